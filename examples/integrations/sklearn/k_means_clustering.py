@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 from sklearn import metrics
 from sklearn.cluster import KMeans
@@ -16,10 +18,8 @@ X = digits.data
 Y = digits.target
 
 
-def k_means_clustering(opytimizer):
-    # Gathers params
-    n_clusters = int(opytimizer[0][0])
-
+@lru_cache(maxsize=None)
+def fit_k_means(n_clusters):
     # Instanciating an KMeans class
     kmeans = KMeans(n_clusters=n_clusters, random_state=1).fit(X)
 
@@ -32,6 +32,14 @@ def k_means_clustering(opytimizer):
     return 1 - ari
 
 
+def k_means_clustering(opytimizer):
+    # Gathers params
+    n_clusters = int(opytimizer[0][0])
+
+    # As positions are continuous, fittings are cached on the discretized parameter
+    return fit_k_means(n_clusters)
+
+
 # Number of agents and decision variables
 n_agents = 10
 n_variables = 1
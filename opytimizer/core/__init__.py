@@ -1,10 +1,21 @@
 """Core package for all common opytimizer modules.
 """
 
+from typing import Any
+
 from opytimizer.core.agent import Agent
 from opytimizer.core.block import InnerBlock, InputBlock, OutputBlock
-from opytimizer.core.cell import Cell
 from opytimizer.core.function import Function
 from opytimizer.core.node import Node
 from opytimizer.core.optimizer import Optimizer
 from opytimizer.core.space import Space
+
+
+def __getattr__(name: str) -> Any:
+    # `Cell` depends on `networkx`, hence it is only imported when first accessed
+    if name == "Cell":
+        from opytimizer.core.cell import Cell
+
+        return Cell
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
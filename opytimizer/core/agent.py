@@ -178,8 +178,11 @@ class Agent:
     def clip_by_bound(self) -> None:
         """Clips the agent's decision variables to the bounds limits."""
 
-        for j, (lb, ub) in enumerate(zip(self.lb, self.ub)):
-            self.position[j] = np.clip(self.position[j], lb, ub)
+        # Bounds are reshaped to be broadcastable over the remaining dimensions
+        shape = (self.n_variables,) + (1,) * (self.position.ndim - 1)
+        lb, ub = self.lb.reshape(shape), self.ub.reshape(shape)
+
+        np.clip(self.position, lb, ub, out=self.position, casting="unsafe")
 
     def fill_with_binary(self) -> None:
         """Fills the agent's decision variables with a binary distribution."""
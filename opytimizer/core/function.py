@@ -1,8 +1,13 @@
 """Single-objective functions.
 """
 
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
 from inspect import signature
+from typing import Any, Dict, List, Optional, Tuple
 
+import dill
 import numpy as np
 
 import opytimizer.utils.exception as e
@@ -10,21 +15,75 @@ from opytimizer.utils import logging
 
 logger = logging.get_logger(__name__)
 
+# Function that is evaluated by each worker process of a pool
+_worker_function = None
+
+# Workers are never forked from the current process, as it might be running threads
+# (e.g., Numba's parallel kernels) that would leave the forked children dead-locked
+_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _initialize_worker(payload: bytes) -> None:
+    """Initializes a worker process by de-serializing the function it will evaluate.
+
+    Args:
+        payload: Function serialized with `dill`.
+
+    """
+
+    global _worker_function
+    _worker_function = dill.loads(payload)
+
+
+def _evaluate_in_worker(x: np.ndarray) -> float:
+    """Evaluates the worker process' function.
+
+    Args:
+        x: Array of positions.
+
+    Returns:
+        (float): Single-objective function fitness.
+
+    """
+
+    return _worker_function(x)
+
 
 class Function:
     """A Function class used to hold single-objective functions."""
 
-    def __init__(self, pointer: callable) -> None:
+    def __init__(
+        self,
+        pointer: callable,
+        vectorized: Optional[bool] = None,
+        cache_size: int = 0,
+    ) -> None:
         """Initialization method.
 
         Args:
             pointer: Pointer to a function that will return the fitness value.
+            vectorized: Whether the pointer evaluates a whole population at once, i.e., receives
+                an array with shape (n_agents, n_variables, n_dimensions) and returns an
+                array of fitness with shape (n_agents,). If not supplied, it is inferred from
+                the pointer's `vectorized` attribute (e.g., `opytimizer.functions.vectorized`).
+            cache_size: Maximum number of positions whose fitness is cached, which avoids
+                re-evaluating repeated positions, e.g., from integer or boolean search spaces.
 
         """
 
         logger.info("Creating class: Function.")
 
+        if vectorized is None:
+            vectorized = getattr(pointer, "vectorized", False) is True
+
         self.pointer = pointer
+        self.vectorized = vectorized
+        self.cache_size = cache_size
+
+        self._pool = None
+        self._n_jobs = 1
 
         if hasattr(pointer, "__name__"):
             self.name = pointer.__name__
@@ -33,7 +92,13 @@ class Function:
 
         self.built = True
 
-        logger.debug("Function: %s | Built: %s.", self.name, self.built)
+        logger.debug(
+            "Function: %s | Vectorized: %s | Cache Size: %s | Built: %s.",
+            self.name,
+            self.vectorized,
+            self.cache_size,
+            self.built,
+        )
         logger.info("Class created.")
 
     def __call__(self, x: np.ndarray) -> float:
@@ -47,8 +112,96 @@ class Function:
 
         """
 
+        # Positions are cached by their shape and values, as arrays are not hashable
+        if self._cache is not None:
+            x = np.asarray(x)
+
+            return self._cache((x.shape, tuple(x.ravel().tolist())))
+
+        return self._evaluate(x)
+
+    def _evaluate(self, x: np.ndarray) -> float:
+        """Evaluates a single position.
+
+        Args:
+            x: Array of positions.
+
+        Returns:
+            (float): Single-objective function fitness.
+
+        """
+
+        # Vectorized pointers are evaluated over a population with a single agent
+        if self.vectorized:
+            return self.pointer(np.asarray(x)[np.newaxis])[0]
+
         return self.pointer(x)
 
+    def _evaluate_key(self, key: Tuple[Tuple[int, ...], Tuple[Any, ...]]) -> float:
+        """Evaluates a single position from its cache key.
+
+        Args:
+            key: Tuple holding the position's shape and values.
+
+        Returns:
+            (float): Single-objective function fitness.
+
+        """
+
+        shape, values = key
+
+        return self._evaluate(np.reshape(np.array(values), shape))
+
+    def batch(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates a population of positions at once.
+
+        Args:
+            x: Array of positions with shape (n_agents, n_variables, n_dimensions).
+
+        Returns:
+            (np.ndarray): Array of fitness with shape (n_agents,).
+
+        """
+
+        if self.vectorized:
+            fits = np.asarray(self.pointer(x), dtype=float)
+        else:
+            fits = np.asarray([self.pointer(position) for position in x], dtype=float)
+
+        if fits.shape != (len(x),):
+            raise e.ValueError(
+                f"`pointer` should return an array with shape ({len(x)},), "
+                f"but returned {fits.shape}"
+            )
+
+        return fits
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Gets the object's state without the pool of worker processes and the cache,
+        which can not be serialized.
+
+        Returns:
+            (Dict[str, Any]): Object's state.
+
+        """
+
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_cache"] = None
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Sets the object's state and re-creates an empty cache (if enabled).
+
+        Args:
+            state: Object's state.
+
+        """
+
+        self.__dict__.update(state)
+        self.cache_size = self._cache_size
+
     @property
     def pointer(self) -> callable:
         """callable: Points to the actual function."""
@@ -64,6 +217,41 @@ class Function:
 
         self._pointer = pointer
 
+    @property
+    def vectorized(self) -> bool:
+        """Indicates whether the function evaluates a whole population at once."""
+
+        return self._vectorized
+
+    @vectorized.setter
+    def vectorized(self, vectorized: bool) -> None:
+        if not isinstance(vectorized, bool):
+            raise e.TypeError("`vectorized` should be a boolean")
+
+        self._vectorized = vectorized
+
+    @property
+    def cache_size(self) -> int:
+        """Maximum number of positions whose fitness is cached."""
+
+        return self._cache_size
+
+    @cache_size.setter
+    def cache_size(self, cache_size: int) -> None:
+        if not isinstance(cache_size, int):
+            raise e.TypeError("`cache_size` should be an integer")
+        if cache_size < 0:
+            raise e.ValueError("`cache_size` should be >= 0")
+
+        self._cache_size = cache_size
+        self._cache = lru_cache(cache_size)(self._evaluate_key) if cache_size else None
+
+    @property
+    def pool(self) -> Optional[Executor]:
+        """Pool of worker processes used to evaluate multiple positions in parallel."""
+
+        return self._pool
+
     @property
     def name(self) -> str:
         """Name of the function."""
@@ -86,3 +274,56 @@ class Function:
     @built.setter
     def built(self, built: bool) -> None:
         self._built = built
+
+    def open_pool(self, n_jobs: int) -> None:
+        """Opens a persistent pool of worker processes, which is re-used
+        until the pool is closed.
+
+        Note that workers are started with the `forkserver` (or `spawn`) method, thus
+        they are never forked from a process that might already be running threads.
+
+        Args:
+            n_jobs: Number of worker processes.
+
+        """
+
+        if not isinstance(n_jobs, int):
+            raise e.TypeError("`n_jobs` should be an integer")
+        if n_jobs <= 0:
+            raise e.ValueError("`n_jobs` should be > 0")
+
+        self.close_pool()
+
+        self._n_jobs = n_jobs
+        self._pool = ProcessPoolExecutor(
+            n_jobs,
+            mp_context=multiprocessing.get_context(_START_METHOD),
+            initializer=_initialize_worker,
+            initargs=(dill.dumps(self, recurse=True),),
+        )
+
+    def close_pool(self) -> None:
+        """Closes the pool of worker processes (if opened)."""
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map(self, x: List[np.ndarray]) -> List[float]:
+        """Evaluates a list of positions, distributing them over the
+        pool of worker processes (if opened).
+
+        Args:
+            x: List of arrays of positions.
+
+        Returns:
+            (List[float]): Single-objective function fitness of each position.
+
+        """
+
+        if self._pool is None:
+            return [self(position) for position in x]
+
+        chunksize = max(1, len(x) // self._n_jobs)
+
+        return list(self._pool.map(_evaluate_in_worker, x, chunksize=chunksize))
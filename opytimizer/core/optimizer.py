@@ -1,10 +1,11 @@
 """Optimizer.
 """
 
-import copy
 import time
 from typing import Any, Dict
 
+import numpy as np
+
 import opytimizer.utils.exception as e
 from opytimizer.core.function import Function
 from opytimizer.core.space import Space
@@ -25,6 +26,11 @@ class Optimizer:
         self.algorithm = self.__class__.__name__
         self.params = {}
 
+        # Fitness of agents that have already been evaluated during the update,
+        # along with the positions they were evaluated at
+        self._evaluated_fits = None
+        self._evaluated_positions = None
+
         self.built = False
 
     @property
@@ -99,6 +105,57 @@ class Optimizer:
 
         pass
 
+    def _evaluate_agents(self, space: Space, function: Function) -> np.ndarray:
+        """Evaluates every agent of the search space, either with a single vectorized
+        call, in parallel over the function's pool or one by one.
+
+        Args:
+            space: A Space object that will be evaluated.
+            function: A Function object serving as an objective function.
+
+        Returns:
+            (np.ndarray): Array of agents' fitness.
+
+        """
+
+        agents = space.agents
+
+        # If the function is vectorized, the whole population
+        # is evaluated with a single call
+        if getattr(function, "vectorized", False):
+            fits = function.batch(space.positions)
+
+            for agent, fit in zip(agents, fits):
+                agent.fit = float(fit)
+
+            return fits
+
+        # If the function has a pool of worker processes,
+        # the agents are evaluated in parallel
+        if getattr(function, "pool", None) is not None:
+            fits = function.map([agent.position for agent in agents])
+
+            for agent, fit in zip(agents, fits):
+                agent.fit = fit
+        else:
+            for agent in agents:
+                agent.fit = function(agent.position)
+
+        return space.gather_fits()
+
+    def _hand_over_fits(self, space: Space, fits: np.ndarray) -> None:
+        """Hands the agents' fitness evaluated during the update over to the next
+        evaluation, which re-uses them as long as the agents have not been moved.
+
+        Args:
+            space: A Space object that has been evaluated.
+            fits: Array of agents' fitness.
+
+        """
+
+        self._evaluated_fits = fits
+        self._evaluated_positions = space.positions.copy()
+
     def evaluate(self, space: Space, function: Function) -> None:
         """Evaluates the search space according to the objective function.
 
@@ -114,13 +171,28 @@ class Optimizer:
 
         """
 
-        for agent in space.agents:
-            agent.fit = function(agent.position)
+        # Agents that have already been evaluated during the update are not evaluated
+        # once again, unless they have been moved since then (e.g., by a callback)
+        agents, best_agent = space.agents, space.best_agent
+
+        fits, self._evaluated_fits = self._evaluated_fits, None
+        positions, self._evaluated_positions = self._evaluated_positions, None
+        if fits is None or not np.array_equal(positions, space.positions):
+            fits = self._evaluate_agents(space, function)
+
+        # Finds the best agent with a single reduction over the array of fitness,
+        # where undefined (NaN) fitness values are never considered the best
+        best = np.argmin(np.where(np.isnan(fits), np.inf, fits))
+
+        if fits[best] < best_agent.fit:
+            agent = agents[best]
 
-            if agent.fit < space.best_agent.fit:
-                space.best_agent.position = copy.deepcopy(agent.position)
-                space.best_agent.fit = copy.deepcopy(agent.fit)
-                space.best_agent.ts = int(time.time())
+            if best_agent.position.shape == agent.position.shape:
+                best_agent.position[...] = agent.position
+            else:
+                best_agent.position = agent.position.copy()
+            best_agent.fit = agent.fit
+            best_agent.ts = int(time.time())
 
     def update(self) -> None:
         """Updates the agents' position array.
@@ -48,6 +48,11 @@ class Space:
 
         self.mapping = mapping
 
+        # Agents' positions are also kept as a contiguous array,
+        # which allows optimizers to perform vectorized operations over them
+        self._positions = np.zeros((n_agents, n_variables, n_dimensions))
+        self._views = []
+
         self.agents = []
         self.best_agent = Agent(
             n_variables, n_dimensions, lower_bound, upper_bound, mapping
@@ -164,6 +169,19 @@ class Space:
 
         self._agents = agents
 
+    @property
+    def positions(self) -> np.ndarray:
+        """Contiguous array of agents' positions with shape (n_agents, n_variables, n_dimensions).
+
+        Each agent's position is a view of a row from this array, thus in-place
+        updates are shared between both of them.
+
+        """
+
+        self._attach_agents()
+
+        return self._positions
+
     @property
     def best_agent(self) -> Agent:
         """Agent: Best agent."""
@@ -198,6 +216,57 @@ class Space:
             for _ in range(self.n_agents)
         ]
 
+        self._views = list(self._positions)
+        for agent, view in zip(self.agents, self._views):
+            agent.position = view
+
+    def _attach_agents(self) -> None:
+        """Attaches the agents' positions to the contiguous array of positions.
+
+        Whenever an agent has been replaced, re-ordered or had its position re-assigned,
+        the positions are gathered into a new array and the agents are re-attached to it.
+        Re-assigned positions that lack the trailing dimensions (e.g., a single value
+        per variable) are broadcasted over them.
+
+        """
+
+        # Views are also checked against the array itself, as copying the space
+        # (e.g., `deepcopy` or `dill`) keeps the identities but not the shared memory
+        agents = self.agents
+        if len(agents) == len(self._views) and all(
+            agent.position is view and view.base is self._positions
+            for agent, view in zip(agents, self._views)
+        ):
+            return
+
+        # Positions are only broadcasted when their shapes disagree, so that every
+        # agent sharing the same (even if unexpected) shape is stacked as it is
+        positions = [agent.position for agent in agents]
+        if any(position.shape != positions[0].shape for position in positions):
+            shape = (self.n_variables, self.n_dimensions)
+            positions = [
+                np.broadcast_to(position.reshape(self.n_variables, -1), shape)
+                for position in positions
+            ]
+
+        self._positions = np.stack(positions)
+
+        self._views = list(self._positions)
+        for agent, view in zip(agents, self._views):
+            agent.position = view
+
+    def gather_fits(self) -> np.ndarray:
+        """Gathers the agents' fitness into an array.
+
+        Returns:
+            (np.ndarray): Array of agents' fitness with shape (n_agents,).
+
+        """
+
+        return np.fromiter(
+            (agent.fit for agent in self.agents), dtype=float, count=len(self.agents)
+        )
+
     def _initialize_agents(self) -> None:
         """Initializes agents with their positions and defines a best agent.
 
@@ -232,5 +301,10 @@ class Space:
     def clip_by_bound(self) -> None:
         """Clips the agents' decision variables to the bounds limits."""
 
-        for agent in self.agents:
-            agent.clip_by_bound()
+        positions = self.positions
+
+        # Bounds are reshaped to be broadcastable over the agents and remaining dimensions
+        shape = (1, self.n_variables) + (1,) * (positions.ndim - 2)
+        lb, ub = self.lb.reshape(shape), self.ub.reshape(shape)
+
+        np.clip(positions, lb, ub, out=positions, casting="unsafe")
@@ -0,0 +1,56 @@
+"""Vectorized benchmarking functions compiled kernels.
+
+Note that this module depends on `numba`, which is an optional dependency,
+thus it should only be imported when it is available.
+"""
+
+from math import cos, pi
+
+import numpy as np
+from numba import guvectorize
+
+
+@guvectorize(
+    ["void(float64[:], float64[:])"],
+    "(n)->()",
+    nopython=True,
+    target="parallel",
+    cache=True,
+)
+def sphere(x: np.ndarray, out: np.ndarray) -> None:
+    """Calculates the Sphere function over the last axis.
+
+    Args:
+        x: Array of flattened positions.
+        out: Output array of fitness.
+
+    """
+
+    s = 0.0
+    for j in range(x.shape[0]):
+        s += x[j] * x[j]
+
+    out[0] = s
+
+
+@guvectorize(
+    ["void(float64[:], float64[:])"],
+    "(n)->()",
+    nopython=True,
+    target="parallel",
+    cache=True,
+)
+def rastrigin(x: np.ndarray, out: np.ndarray) -> None:
+    """Calculates the Rastrigin function over the last axis.
+
+    Args:
+        x: Array of flattened positions.
+        out: Output array of fitness.
+
+    """
+
+    s = 10.0 * x.shape[0]
+    for j in range(x.shape[0]):
+        s += x[j] * x[j] - 10.0 * cos(2 * pi * x[j])
+
+    out[0] = s
@@ -79,7 +79,21 @@ class ConstrainedFunction(Function):
 
         """
 
-        fitness = self.pointer(x)
+        fitness = self._evaluate(x)
+
+        return self._penalize(x, fitness)
+
+    def _penalize(self, x: np.ndarray, fitness: float) -> float:
+        """Penalizes the fitness of a single position for every invalid constraint.
+
+        Args:
+            x: Array of positions.
+            fitness: Single-objective function fitness.
+
+        Returns:
+            (float): Penalized fitness.
+
+        """
 
         for constraint in self.constraints:
             if constraint(x):
@@ -88,3 +102,21 @@ class ConstrainedFunction(Function):
                 fitness += self.penalty * fitness
 
         return fitness
+
+    def batch(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates a population of positions at once, penalizing each of them.
+
+        Args:
+            x: Array of positions with shape (n_agents, n_variables, n_dimensions).
+
+        Returns:
+            (np.ndarray): Array of constrained fitness with shape (n_agents,).
+
+        """
+
+        fits = super(ConstrainedFunction, self).batch(x)
+
+        for i, (position, fit) in enumerate(zip(x, fits)):
+            fits[i] = self._penalize(position, fit)
+
+        return fits
@@ -0,0 +1,88 @@
+"""Vectorized benchmarking functions.
+
+These functions evaluate a whole population at once, i.e., they receive an array
+with shape (n_agents, n_variables, n_dimensions) and return an array of fitness with
+shape (n_agents,). As they are marked with a `vectorized` attribute, `Function(pointer)`
+automatically routes the population's evaluation to a single call.
+"""
+
+import numpy as np
+
+# Compiled kernels are only available when `numba` is installed,
+# otherwise the functions fall back to their NumPy-based implementations
+try:
+    from opytimizer.functions import _vectorized_kernels as k
+except ImportError:
+    k = None
+
+
+def _flatten(x: np.ndarray) -> np.ndarray:
+    """Flattens a population of positions into a (n_agents, n_features) array.
+
+    Args:
+        x: Array of positions with shape (n_agents, n_variables, n_dimensions).
+
+    Returns:
+        (np.ndarray): Array of flattened positions.
+
+    """
+
+    x = np.asarray(x, dtype=float)
+
+    return x.reshape(x.shape[0], -1)
+
+
+def _vectorized(pointer: callable) -> callable:
+    """Marks a pointer as vectorized, allowing `Function` to evaluate populations at once.
+
+    Args:
+        pointer: Pointer to a vectorized function.
+
+    Returns:
+        (callable): The marked pointer.
+
+    """
+
+    pointer.vectorized = True
+
+    return pointer
+
+
+@_vectorized
+def sphere(x: np.ndarray) -> np.ndarray:
+    """Sphere function: f(x) = sum(x_i^2).
+
+    Args:
+        x: Array of positions with shape (n_agents, n_variables, n_dimensions).
+
+    Returns:
+        (np.ndarray): Array of fitness with shape (n_agents,).
+
+    """
+
+    x = _flatten(x)
+
+    if k is not None:
+        return k.sphere(x)
+
+    return np.einsum("ij,ij->i", x, x)
+
+
+@_vectorized
+def rastrigin(x: np.ndarray) -> np.ndarray:
+    """Rastrigin function: f(x) = 10n + sum(x_i^2 - 10cos(2pi x_i)).
+
+    Args:
+        x: Array of positions with shape (n_agents, n_variables, n_dimensions).
+
+    Returns:
+        (np.ndarray): Array of fitness with shape (n_agents,).
+
+    """
+
+    x = _flatten(x)
+
+    if k is not None:
+        return k.rastrigin(x)
+
+    return 10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1)
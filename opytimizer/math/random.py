@@ -20,6 +20,26 @@ def generate_binary_random_number(size: int = 1) -> np.ndarray:
     return binary_array
 
 
+def generate_binomial_random_number(
+    n: int = 1, p: float = 0.5, size: int = 1
+) -> np.ndarray:
+    """Generates a random number or array based on a binomial distribution.
+
+    Args:
+        n: Number of trials.
+        p: Probability of success of each trial.
+        size: Size of array.
+
+    Returns:
+        (np.ndarray): A binomial random number or array.
+
+    """
+
+    binomial_array = np.random.binomial(n, p, size)
+
+    return binomial_array
+
+
 def generate_exponential_random_number(scale: float = 1.0, size: int = 1) -> np.ndarray:
     """Generates a random number or array based on an exponential distribution.
 
@@ -87,6 +107,42 @@ def generate_integer_random_number(
     return integer_array
 
 
+def generate_unique_integer_random_number(
+    low: int = 0, high: int = 1, size: int = 1
+) -> np.ndarray:
+    """Generates an array of distinct integers, i.e., sampled without replacement.
+
+    Instead of permuting the whole interval, integers are drawn with replacement
+    and the repeated ones are drawn again, thus costing O(size log size).
+
+    Args:
+        low: Lower interval.
+        high: Higher interval.
+        size: Size of array.
+
+    Returns:
+        (np.ndarray): A sorted array of distinct integers.
+
+    """
+
+    n = high - low
+
+    # Whenever most of the interval is sampled, its complement is sampled instead,
+    # which avoids re-drawing most of the integers
+    if 2 * size > n:
+        mask = np.ones(n, dtype=bool)
+        mask[generate_unique_integer_random_number(0, n, n - size)] = False
+
+        return low + np.flatnonzero(mask)
+
+    unique_array = np.unique(np.random.randint(0, n, size))
+    while len(unique_array) < size:
+        integer_array = np.random.randint(0, n, size - len(unique_array))
+        unique_array = np.unique(np.concatenate((unique_array, integer_array)))
+
+    return low + unique_array
+
+
 def generate_uniform_random_number(
     low: float = 0.0, high: float = 1.0, size: int = 1
 ) -> np.ndarray:
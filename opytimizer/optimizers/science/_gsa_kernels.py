@@ -0,0 +1,105 @@
+"""Gravitational Search Algorithm compiled kernels.
+
+Note that this module depends on `numba`, which is an optional dependency,
+thus it should only be imported when it is available.
+"""
+
+from math import sqrt
+
+import numpy as np
+from numba import njit, prange
+
+import opytimizer.utils.constant as c
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def calculate_mass(fits: np.ndarray) -> np.ndarray:
+    """Calculates agents' mass (eq. 15-16).
+
+    Args:
+        fits: Array of agents' fitness.
+
+    Returns:
+        (np.ndarray): The agents' mass.
+
+    """
+
+    best, worst = fits.min(), fits.max()
+
+    mass = fits - worst
+    if best != worst:
+        mass /= best - worst
+
+    total_mass = mass.sum()
+    if total_mass > 0:
+        norm_mass = mass / total_mass
+    else:
+        norm_mass = np.full_like(mass, 1 / len(mass))
+
+    return norm_mass
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def calculate_force(
+    positions: np.ndarray, mass: np.ndarray, gravity: float, rand: np.ndarray
+) -> np.ndarray:
+    """Calculates agents' force (eq. 7-9).
+
+    Args:
+        positions: Array of agents' flattened positions with shape (n_agents, n_features).
+        mass: Array of agents' mass.
+        gravity: Current gravity value.
+        rand: Array of uniform random numbers with shape (n_agents, n_agents).
+
+    Returns:
+        (np.ndarray): The attraction force between all agents.
+
+    """
+
+    n_agents, n_features = positions.shape
+
+    force = np.zeros((n_agents, n_features))
+
+    for i in prange(n_agents):
+        for j in range(n_agents):
+            distance = 0.0
+            for k in range(n_features):
+                diff = positions[j, k] - positions[i, k]
+                distance += diff * diff
+
+            coef = (
+                gravity * mass[i] * mass[j] / (sqrt(distance) + c.EPSILON) * rand[i, j]
+            )
+            for k in range(n_features):
+                force[i, k] += coef * (positions[j, k] - positions[i, k])
+
+    return force
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def update_velocity_and_position(
+    positions: np.ndarray,
+    velocity: np.ndarray,
+    force: np.ndarray,
+    mass: np.ndarray,
+    rand: np.ndarray,
+) -> None:
+    """Updates agents' velocity and position in-place (eq. 10-12).
+
+    Args:
+        positions: Array of agents' flattened positions with shape (n_agents, n_features).
+        velocity: Array of agents' flattened velocities with shape (n_agents, n_features).
+        force: Array of agents' force.
+        mass: Array of agents' mass.
+        rand: Array of uniform random numbers with shape (n_agents,).
+
+    """
+
+    n_agents, n_features = positions.shape
+
+    for i in prange(n_agents):
+        for k in range(n_features):
+            acceleration = force[i, k] / (mass[i] + c.EPSILON)
+
+            velocity[i, k] = rand[i] * velocity[i, k] + acceleration
+            positions[i, k] += velocity[i, k]
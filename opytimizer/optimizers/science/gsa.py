@@ -1,21 +1,32 @@
 """Gravitational Search Algorithm.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import numpy as np
 
-import opytimizer.math.general as g
 import opytimizer.math.random as r
 import opytimizer.utils.constant as c
 import opytimizer.utils.exception as e
 from opytimizer.core import Optimizer
-from opytimizer.core.agent import Agent
 from opytimizer.core.space import Space
 from opytimizer.utils import logging
 
 logger = logging.get_logger(__name__)
 
+# Compiled kernels are only available when `numba` is installed,
+# otherwise the update falls back to its NumPy-based implementation
+try:
+    from opytimizer.optimizers.science import _gsa_kernels as k
+except ImportError:
+    k = None
+
+# GPU-based force calculation is only available when `cupy` is installed
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
 
 class GSA(Optimizer):
     """A GSA class, inherited from Optimizer.
@@ -43,6 +54,8 @@ class GSA(Optimizer):
 
         self.G = 2.467
 
+        self.device = "cpu"
+
         self.build(params)
 
         logger.info("Class overrided.")
@@ -62,6 +75,23 @@ class GSA(Optimizer):
 
         self._G = G
 
+    @property
+    def device(self) -> str:
+        """Device used to calculate the force (`cpu` or `cuda`)."""
+
+        return self._device
+
+    @device.setter
+    def device(self, device: str) -> None:
+        if not isinstance(device, str):
+            raise e.TypeError("`device` should be a string")
+        if device not in ["cpu", "cuda"]:
+            raise e.ValueError("`device` should be `cpu` or `cuda`")
+        if device == "cuda" and cp is None:
+            raise e.ValueError("`device` should be `cpu` when `cupy` is not installed")
+
+        self._device = device
+
     @property
     def velocity(self) -> np.ndarray:
         """Array of velocities."""
@@ -87,58 +117,134 @@ class GSA(Optimizer):
             (space.n_agents, space.n_variables, space.n_dimensions)
         )
 
-    def _calculate_mass(self, agents: List[Agent]) -> float:
+        # Pre-allocates the buffers used when calculating the force
+        self._diff = np.zeros((space.n_agents, space.n_variables * space.n_dimensions))
+        self._force = np.zeros((space.n_agents, space.n_variables * space.n_dimensions))
+
+    def _calculate_mass(self, fits: np.ndarray) -> np.ndarray:
         """Calculates agents' mass (eq. 16).
 
         Args:
-            agents: List of agents.
+            fits: Array of agents' fitness.
 
         Returns:
-            (float): The agents' mass.
+            (np.ndarray): The agents' mass.
 
         """
 
-        best, worst = agents[0].fit, agents[-1].fit
+        best, worst = fits.min(), fits.max()
 
-        # Calculates agents' masses (eq. 15)
-        mass = [(agent.fit - worst) / (best - worst + c.EPSILON) for agent in agents]
-        norm_mass = mass / (np.sum(mass) + c.EPSILON)
+        # Calculates agents' masses (eq. 15), where agents with the same fitness
+        # will have null masses instead of undefined ones
+        mass = fits - worst
+        if best != worst:
+            mass /= best - worst
+
+        # If every agent has a null mass, they will share the same normalized mass
+        total_mass = mass.sum()
+        if total_mass > 0:
+            norm_mass = mass / total_mass
+        else:
+            norm_mass = np.full_like(mass, 1 / len(mass))
 
         return norm_mass
 
     def _calculate_force(
-        self, agents: List[Agent], mass: np.ndarray, gravity: float
-    ) -> float:
+        self,
+        positions: np.ndarray,
+        mass: np.ndarray,
+        gravity: float,
+        rand: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """Calculates agents' force (eq. 7-9).
 
         Args:
-            agents: List of agents.
+            positions: Array of agents' positions.
+            mass: An array of agents' mass.
+            gravity: Current gravity value.
+            rand: Array of uniform random numbers with shape (n_agents, n_agents).
+
+        Returns:
+            (np.ndarray): The attraction force between all agents.
+
+        """
+
+        n_agents = positions.shape[0]
+        flat_positions = positions.reshape(n_agents, -1)
+
+        # Re-uses the pre-allocated buffers whenever their shapes are still valid
+        if self._diff.shape != flat_positions.shape:
+            self._diff = np.zeros(flat_positions.shape)
+            self._force = np.zeros(flat_positions.shape)
+
+        diff, force = self._diff, self._force
+
+        if rand is None:
+            rand = r.generate_uniform_random_number(size=(n_agents, n_agents))
+
+        # Hoists the loop invariants into local variables
+        subtract, dot, norm = np.subtract, np.dot, np.linalg.norm
+        gravity_mass = gravity * mass
+
+        for i in range(n_agents):
+            # Calculates the differences between every agent and the current one,
+            # as well as their euclidean distances
+            subtract(flat_positions, flat_positions[i], out=diff)
+            distance = norm(diff, axis=1)
+
+            # Calculates the randomly-weighted force between the current agent and
+            # every other agent (eq. 7)
+            coef = gravity_mass[i] * mass / (distance + c.EPSILON) * rand[i]
+            coef[i] = 0
+
+            # Sums the force exerted by all agents (eq. 9)
+            dot(coef, diff, out=force[i])
+
+        return force.reshape(positions.shape)
+
+    def _calculate_pairwise_force(
+        self,
+        positions: np.ndarray,
+        mass: np.ndarray,
+        gravity: float,
+        rand: np.ndarray,
+        xp: Any = np,
+    ) -> np.ndarray:
+        """Calculates agents' force (eq. 7-9) with matrix operations over all pairs of agents,
+        which suits array modules that run on GPUs, such as `cupy`.
+
+        Args:
+            positions: Array of agents' positions.
             mass: An array of agents' mass.
             gravity: Current gravity value.
+            rand: Array of uniform random numbers with shape (n_agents, n_agents).
+            xp: Array module used to perform the calculation (`numpy` or `cupy`).
 
         Returns:
-            (float): The attraction force between all agents.
+            (np.ndarray): The attraction force between all agents (as an `xp` array).
 
         """
 
-        force = [
-            [
-                gravity
-                * (mass[i] * mass[j])
-                / (
-                    g.euclidean_distance(agents[i].position, agents[j].position)
-                    + c.EPSILON
-                )
-                * (agents[j].position - agents[i].position)
-                for j in range(len(agents))
-            ]
-            for i in range(len(agents))
-        ]
-
-        force = np.asarray(force)
-        force = np.sum(r.generate_uniform_random_number() * force, axis=1)
-
-        return force
+        n_agents = positions.shape[0]
+
+        x = xp.asarray(positions.reshape(n_agents, -1))
+        mass, rand = xp.asarray(mass), xp.asarray(rand)
+
+        # Calculates the euclidean distances between all agents through
+        # the expansion ||x_i - x_j||^2 = ||x_i||^2 + ||x_j||^2 - 2 x_i . x_j
+        sq_norm = xp.sum(x * x, axis=1)
+        sq_distance = sq_norm[:, None] + sq_norm[None, :] - 2 * (x @ x.T)
+        distance = xp.sqrt(xp.maximum(sq_distance, 0))
+
+        # Calculates the randomly-weighted force between all agents (eq. 7)
+        coef = gravity * mass[:, None] * mass[None, :] / (distance + c.EPSILON) * rand
+        xp.fill_diagonal(coef, 0)
+
+        # Sums the force exerted by all agents (eq. 9), where
+        # sum_j coef_ij (x_j - x_i) = (coef x)_i - sum_j coef_ij x_i
+        force = coef @ x - coef.sum(axis=1)[:, None] * x
+
+        return force.reshape(positions.shape)
 
     def update(self, space: Space, iteration: int) -> None:
         """Wraps Gravitational Search Algorithm over all agents and variables.
@@ -149,19 +255,41 @@ class GSA(Optimizer):
 
         """
 
-        space.agents.sort(key=lambda x: x.fit)
-
-        gravity = self.G / (iteration + 1)
-        mass = self._calculate_mass(space.agents)
-        force = self._calculate_force(space.agents, mass, gravity)
+        n_agents = len(space.agents)
 
-        for i, agent in enumerate(space.agents):
-            # Calculates the acceleration (eq. 10)
-            acceleration = force[i] / (mass[i] + c.EPSILON)
+        # Flattens the positions and velocities into (n_agents, n_features) views
+        positions = space.positions.reshape(n_agents, -1)
+        velocity = self.velocity.reshape(n_agents, -1)
 
-            # Updates current agent velocity (eq. 11)
-            r1 = r.generate_uniform_random_number()
-            self.velocity[i] = r1 * self.velocity[i] + acceleration
+        gravity = self.G / (iteration + 1)
 
-            # Updates current agent position (eq. 12)
-            agent.position += self.velocity[i]
+        # Draws every random number used by the iteration at once
+        r_force = r.generate_uniform_random_number(size=(n_agents, n_agents))
+        r_velocity = r.generate_uniform_random_number(size=n_agents)
+
+        # Offloads the pairwise force to the GPU, while the remaining
+        # O(n_agents) operations are kept along with the agents on the CPU
+        if self.device == "cuda":
+            mass = self._calculate_mass(space.gather_fits())
+            force = cp.asnumpy(
+                self._calculate_pairwise_force(positions, mass, gravity, r_force, cp)
+            )
+        elif k is not None:
+            mass = k.calculate_mass(space.gather_fits())
+            force = k.calculate_force(positions, mass, gravity, r_force)
+            k.update_velocity_and_position(positions, velocity, force, mass, r_velocity)
+
+            return
+        else:
+            mass = self._calculate_mass(space.gather_fits())
+            force = self._calculate_force(positions, mass, gravity, r_force)
+
+        # Calculates the acceleration (eq. 10), re-using the force's buffer
+        acceleration = np.divide(force, (mass + c.EPSILON)[:, np.newaxis], out=force)
+
+        # Updates agents' velocity (eq. 11)
+        velocity *= r_velocity[:, np.newaxis]
+        velocity += acceleration
+
+        # Updates agents' position (eq. 12)
+        positions += velocity
@@ -0,0 +1,43 @@
+"""Satin Bowerbird Optimizer compiled kernels.
+
+Note that this module depends on `numba`, which is an optional dependency,
+thus it should only be imported when it is available.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def update_position(
+    positions: np.ndarray,
+    previous_positions: np.ndarray,
+    best_position: np.ndarray,
+    probs: np.ndarray,
+    s: np.ndarray,
+    alpha: float,
+) -> None:
+    """Updates agents' position towards the chosen and best bowers in-place.
+
+    Args:
+        positions: Agents' positions with shape (n_agents, n_variables, n_dimensions).
+        previous_positions: Agents' positions from the beginning of the iteration.
+        best_position: Best agent's position with shape (n_variables, n_dimensions).
+        probs: Array of bowers' probabilities.
+        s: Array of chosen bowers with shape (n_agents, n_variables).
+        alpha: Step size.
+
+    """
+
+    n_agents, n_variables, n_dimensions = positions.shape
+
+    for i in prange(n_agents):
+        for j in range(n_variables):
+            chosen = s[i, j]
+            lambda_k = alpha / (1 + probs[chosen])
+
+            for d in range(n_dimensions):
+                positions[i, j, d] += lambda_k * (
+                    (previous_positions[chosen, j, d] + best_position[j, d]) / 2
+                    - previous_positions[i, j, d]
+                )
@@ -1,7 +1,7 @@
 """Bat Algorithm.
 """
 
-import copy
+import time
 from typing import Any, Dict, Optional
 
 import numpy as np
@@ -181,6 +181,9 @@ class BA(Optimizer):
         self.loudness = rnd.generate_uniform_random_number(0, self.A, space.n_agents)
         self.pulse_rate = rnd.generate_uniform_random_number(0, self.r, space.n_agents)
 
+        # Pre-allocates the buffer used when updating the velocities
+        self._step = np.zeros((space.n_agents, space.n_variables, space.n_dimensions))
+
     def update(self, space: Space, function: Function, iteration: int) -> None:
         """Wraps Bat Algorithm over all agents and variables.
 
@@ -193,36 +196,57 @@ class BA(Optimizer):
 
         alpha = 0.9
 
-        for i, agent in enumerate(space.agents):
-            # Updates frequency (eq. 2)
-            # Note that we have to apply (min - max) instead of (max - min) or it will not converge
-            beta = rnd.generate_uniform_random_number()
-            self.frequency[i] = self.f_min + (self.f_min - self.f_max) * beta
-
-            # Updates velocity (eq. 3)
-            self.velocity[i] += (
-                agent.position - space.best_agent.position
-            ) * self.frequency[i]
-
-            # Updates agent's position (eq. 4)
-            agent.position += self.velocity[i]
-
-            p = rnd.generate_uniform_random_number()
-            e = rnd.generate_gaussian_random_number()
-            if p > self.pulse_rate[i]:
-                # Performs a local random walk (eq. 5)
-                # We apply 0.001 to limit the step size
-                agent.position = space.best_agent.position + 0.001 * e * np.mean(
-                    self.loudness
-                )
-            agent.clip_by_bound()
-
-            agent.fit = function(agent.position)
-            if p < self.loudness[i] and agent.fit < space.best_agent.fit:
-                space.best_agent = copy.deepcopy(agent)
-
-                # Increasing pulse rate (eq. 6 - left)
-                self.pulse_rate[i] = self.r * (1 - np.exp(-alpha * iteration))
-
-                # Decreasing loudness (eq. 6 - right)
-                self.loudness[i] = self.A * alpha
+        agents, best_agent = space.agents, space.best_agent
+
+        n_agents = len(agents)
+        positions = space.positions
+        best_position = best_agent.position
+
+        # Updates frequencies (eq. 2)
+        # Note that we have to apply (min - max) instead of (max - min) or it will not converge
+        beta = rnd.generate_uniform_random_number(size=n_agents)
+        self.frequency[:] = self.f_min + (self.f_min - self.f_max) * beta
+
+        # Updates velocities (eq. 3)
+        step = np.subtract(positions, best_position, out=self._step)
+        step *= self.frequency[:, np.newaxis, np.newaxis]
+        self.velocity += step
+
+        # Updates agents' positions (eq. 4)
+        positions += self.velocity
+
+        # Performs a local random walk (eq. 5)
+        # We apply 0.001 to limit the step size
+        p = rnd.generate_uniform_random_number(size=n_agents)
+        e = rnd.generate_gaussian_random_number(size=n_agents)
+        walk = p > self.pulse_rate
+        noise = 0.001 * e[walk, np.newaxis, np.newaxis] * np.mean(self.loudness)
+        positions[walk] = best_position + noise
+        space.clip_by_bound()
+
+        fits = self._evaluate_agents(space, function)
+
+        # An agent improves whenever it beats the best fitness found by itself or by any
+        # of the previous agents, where undefined (NaN) fitness values are ignored
+        candidate_fits = np.where(p < self.loudness, fits, np.nan)
+        previous_best = np.fmin.accumulate(
+            np.concatenate(([best_agent.fit], candidate_fits[:-1]))
+        )
+        improved = candidate_fits < previous_best
+
+        if np.any(improved):
+            best = np.flatnonzero(improved)[-1]
+
+            best_position[...] = positions[best]
+            best_agent.fit = agents[best].fit
+            best_agent.ts = int(time.time())
+
+            # Increasing pulse rate (eq. 6 - left)
+            self.pulse_rate[improved] = self.r * (1 - np.exp(-alpha * iteration))
+
+            # Decreasing loudness (eq. 6 - right)
+            self.loudness[improved] = self.A * alpha
+
+        # As every agent has already been evaluated, the next
+        # evaluation only needs to look for the best agent
+        self._hand_over_fits(space, fits)
@@ -1,11 +1,10 @@
 """Satin Bowerbird Optimizer.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import numpy as np
 
-import opytimizer.math.distribution as d
 import opytimizer.math.random as r
 import opytimizer.utils.exception as e
 from opytimizer.core import Optimizer
@@ -15,6 +14,13 @@ from opytimizer.utils import logging
 
 logger = logging.get_logger(__name__)
 
+# Compiled kernels are only available when `numba` is installed,
+# otherwise the update falls back to its NumPy-based implementation
+try:
+    from opytimizer.optimizers.swarm import _sbo_kernels as k
+except ImportError:
+    k = None
+
 
 class SBO(Optimizer):
     """A SBO class, inherited from Optimizer.
@@ -94,15 +100,15 @@ class SBO(Optimizer):
         self._z = z
 
     @property
-    def sigma(self) -> List[float]:
-        """List of widths."""
+    def sigma(self) -> np.ndarray:
+        """Array of widths."""
 
         return self._sigma
 
     @sigma.setter
-    def sigma(self, sigma: List[float]) -> None:
-        if not isinstance(sigma, list):
-            raise e.TypeError("`sigma` should be a list")
+    def sigma(self, sigma: np.ndarray) -> None:
+        if not isinstance(sigma, np.ndarray):
+            raise e.TypeError("`sigma` should be a numpy array")
 
         self._sigma = sigma
 
@@ -114,7 +120,14 @@ class SBO(Optimizer):
 
         """
 
-        self.sigma = [self.z * (ub - lb) for lb, ub in zip(space.lb, space.ub)]
+        self.sigma = self.z * (
+            np.asarray(space.ub, dtype=float) - np.asarray(space.lb, dtype=float)
+        )
+
+        # Pre-allocates the buffers used when updating the positions
+        shape = (space.n_agents, space.n_variables, space.n_dimensions)
+        self._previous_positions = np.zeros(shape)
+        self._step = np.zeros(shape)
 
     def update(self, space: Space, function: Function) -> None:
         """Wraps Satin Bowerbird Optimizer over all agents and variables (eq. 1-7).
@@ -125,29 +138,85 @@ class SBO(Optimizer):
 
         """
 
-        fitness = [
-            1 / (1 + agent.fit) if agent.fit >= 0 else 1 + np.abs(agent.fit)
-            for agent in space.agents
-        ]
-        total_fitness = np.sum(fitness)
-        probs = [fit / total_fitness for fit in fitness]
-
-        for agent in space.agents:
-            for j in range(agent.n_variables):
-                s = d.generate_choice_distribution(len(space.agents), probs, 1)[0]
-
-                lambda_k = self.alpha / (1 + probs[s])
-
-                agent.position[j] += lambda_k * (
-                    (space.agents[s].position[j] + space.best_agent.position[j]) / 2
-                    - agent.position[j]
-                )
-
-                r1 = r.generate_uniform_random_number()
-                if r1 < self.p_mutation:
-                    agent.position[j] += (
-                        self.sigma[j] * r.generate_gaussian_random_number()
-                    )
-            agent.clip_by_bound()
-
-            agent.fit = function(agent.position)
+        n_agents, n_variables = space.n_agents, space.n_variables
+        alpha, p_mutation, sigma = self.alpha, self.p_mutation, self.sigma
+
+        # Calculates the bowers' fitness, where `1 - fit` equals `1 + |fit|` for
+        # negative values and the absolute value keeps the unused branch finite
+        fits = space.gather_fits()
+        fitness = np.where(fits >= 0, 1 / (1 + np.abs(fits)), 1 - fits)
+        total_fitness = fitness.sum()
+        probs = fitness / total_fitness
+
+        positions = space.positions
+        best_position = space.best_agent.position
+
+        # Draws the bower chosen by every agent and variable at once
+        r_choice = r.generate_uniform_random_number(size=(n_agents, n_variables))
+
+        # Chooses the bowers by inverting their cumulative distribution, which is built
+        # only once for every agent and variable
+        cdf = np.cumsum(probs)
+        s = np.searchsorted(cdf, r_choice * cdf[-1], side="right")
+        s = np.minimum(s, n_agents - 1, out=s)
+
+        # Re-uses the pre-allocated buffers whenever their shapes are still valid
+        if self._previous_positions.shape != positions.shape:
+            self._previous_positions = np.zeros(positions.shape)
+            self._step = np.zeros(positions.shape)
+
+        # Every agent is updated based on the bowers from the iteration's beginning
+        previous_positions = self._previous_positions
+        np.copyto(previous_positions, positions)
+
+        if k is not None:
+            k.update_position(
+                positions, previous_positions, best_position, probs, s, alpha
+            )
+        else:
+            # Calculates the step sizes
+            lambda_k = alpha / (1 + probs[s])
+
+            # Gathers the chosen bowers, indexed over the flattened agents and variables
+            step = self._step
+            chosen = s * n_variables + np.arange(n_variables)
+            np.take(
+                previous_positions.reshape(n_agents * n_variables, -1),
+                chosen,
+                axis=0,
+                out=step,
+            )
+
+            # Updates the agents' positions towards the chosen and best bowers
+            step += best_position
+            step /= 2
+            step -= previous_positions
+            step *= lambda_k[:, :, np.newaxis]
+            positions += step
+
+        # As every variable mutates with probability `p_mutation`, the number of
+        # mutations follows a binomial distribution, thus only the mutated variables
+        # (sampled without replacement) need their gaussian numbers
+        n_variables_total = n_agents * n_variables
+        n_mutations = 0
+        if p_mutation > 0:
+            n_mutations = int(
+                r.generate_binomial_random_number(n_variables_total, p_mutation)[0]
+            )
+        if n_mutations > 0:
+            idx = r.generate_unique_integer_random_number(
+                0, n_variables_total, n_mutations
+            )
+            i, j = np.divmod(idx, n_variables)
+
+            # Mutates the agents' positions
+            r1 = r.generate_gaussian_random_number(size=n_mutations)
+            positions[i, j] += (sigma[j] * r1)[:, np.newaxis]
+
+        space.clip_by_bound()
+
+        fits = self._evaluate_agents(space, function)
+
+        # As every agent has already been evaluated, the next
+        # evaluation only needs to look for the best agent
+        self._hand_over_fits(space, fits)
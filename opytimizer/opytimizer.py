@@ -90,6 +90,10 @@ class Opytimizer:
 
         self._optimizer = optimizer
 
+        # The names of `evaluate` and `update` arguments are only inspected once
+        self._evaluate_params = list(signature(optimizer.evaluate).parameters)
+        self._update_params = list(signature(optimizer.update).parameters)
+
     @property
     def function(self) -> Function:
         """Function or Function-child instance (ConstrainedFunction, WeightedFunction, etc)."""
@@ -155,9 +159,7 @@ class Opytimizer:
 
         """
 
-        args = signature(self.optimizer.evaluate).parameters
-
-        return [getattr(self, v) for v in args]
+        return [getattr(self, v) for v in self._evaluate_params]
 
     @property
     def update_args(self) -> List[Any]:
@@ -168,9 +170,7 @@ class Opytimizer:
 
         """
 
-        args = signature(self.optimizer.update).parameters
-
-        return [getattr(self, v) for v in args]
+        return [getattr(self, v) for v in self._update_params]
 
     def evaluate(self, callbacks: List[Callback]) -> None:
         """Wraps the `evaluate` pipeline with its corresponding callbacks.
@@ -180,9 +180,13 @@ class Opytimizer:
 
         """
 
-        callbacks.on_evaluate_before(*self.evaluate_args)
-        self.optimizer.evaluate(*self.evaluate_args)
-        callbacks.on_evaluate_after(*self.evaluate_args)
+        # Callbacks are only dispatched when there is any of them
+        if callbacks.callbacks:
+            callbacks.on_evaluate_before(*self.evaluate_args)
+            self.optimizer.evaluate(*self.evaluate_args)
+            callbacks.on_evaluate_after(*self.evaluate_args)
+        else:
+            self.optimizer.evaluate(*self.evaluate_args)
 
     def update(self, callbacks: List[Callback]) -> None:
         """Wraps the `update` pipeline with its corresponding callbacks.
@@ -192,9 +196,13 @@ class Opytimizer:
 
         """
 
-        callbacks.on_update_before(*self.update_args)
-        self.optimizer.update(*self.update_args)
-        callbacks.on_update_after(*self.update_args)
+        # Callbacks are only dispatched when there is any of them
+        if callbacks.callbacks:
+            callbacks.on_update_before(*self.update_args)
+            self.optimizer.update(*self.update_args)
+            callbacks.on_update_after(*self.update_args)
+        else:
+            self.optimizer.update(*self.update_args)
 
         # Regardless of callbacks or not, every update on the search space
         # must meet the bounds limits
@@ -204,12 +212,14 @@ class Opytimizer:
         self,
         n_iterations: int = 1,
         callbacks: Optional[List[Callback]] = None,
+        n_jobs: int = 1,
     ) -> None:
         """Starts the optimization task.
 
         Args
             n_iterations: Maximum number of iterations.
             callback: List of callbacks.
+            n_jobs: Number of worker processes used to evaluate the agents in parallel.
 
         """
 
@@ -218,6 +228,27 @@ class Opytimizer:
         self.n_iterations = n_iterations
         callbacks = CallbackVessel(callbacks)
 
+        # The pool of worker processes is created once and re-used throughout
+        # every evaluation of the optimization task
+        if n_jobs != 1:
+            self.function.open_pool(n_jobs)
+
+        try:
+            self._run(callbacks)
+        finally:
+            if n_jobs != 1:
+                self.function.close_pool()
+
+    def _run(self, callbacks: CallbackVessel) -> None:
+        """Runs the optimization loop.
+
+        Args:
+            callbacks: Vessel of callbacks.
+
+        """
+
+        n_iterations = self.n_iterations
+
         start = time.time()
 
         callbacks.on_task_begin(self)
@@ -226,8 +257,6 @@ class Opytimizer:
 
         with tqdm(total=n_iterations, ascii=True) as b:
             for t in range(n_iterations):
-                logger.to_file(f"Iteration {t+1}/{n_iterations}")
-
                 self.total_iterations += 1
                 self.iteration = t
 
@@ -245,8 +274,16 @@ class Opytimizer:
 
                 callbacks.on_iteration_end(self.total_iterations, self)
 
-                logger.to_file(f"Fitness: {self.space.best_agent.fit}")
-                logger.to_file(f"Position: {self.space.best_agent.position}")
+                # Only the fitness is logged per iteration, as formatting the
+                # whole position would cost O(n_variables) on every iteration
+                logger.to_file(
+                    "Iteration %d/%d | Fitness: %s",
+                    t + 1,
+                    n_iterations,
+                    self.space.best_agent.fit,
+                )
+
+        logger.to_file("Position: %s", self.space.best_agent.position)
 
         callbacks.on_task_end(self)
 
@@ -39,7 +39,9 @@ class History:
 
         self._save_agents = save_agents
 
-    def _parse(self, key: str, value: Any) -> Union[List[Any], Tuple[List[Any], float]]:
+    def _parse(
+        self, key: str, value: Any
+    ) -> Union[List[Any], Tuple[np.ndarray, Union[np.ndarray, float]]]:
         """Parses incoming values with specified formats.
 
         Args:
@@ -47,17 +49,21 @@ class History:
             value: Value.
 
         Returns:
-            (Union[List[Any], Tuple[List[Any], float]]): Parsed value according to the specified format.
+            (Union[List[Any], Tuple[np.ndarray, Union[np.ndarray, float]]]): Parsed value
+                according to the specified format.
 
         """
 
         if key == "agents":
-            # Returns a list of tuples (position, fit)
-            return [(v.position.tolist(), v.fit) for v in value]
+            # Returns a tuple of contiguous arrays (positions, fits)
+            positions = np.stack([v.position for v in value])
+            fits = np.fromiter((v.fit for v in value), dtype=float, count=len(value))
+
+            return (positions, fits)
 
         if key == "best_agent":
             # Returns a tuple (position, fit)
-            return (value.position.tolist(), value.fit)
+            return (value.position.copy(), value.fit)
 
         if key == "local_position":
             # Returns a list of local positions
@@ -100,20 +106,22 @@ class History:
 
         """
 
-        attr = np.asarray(getattr(self, key), dtype=list)
+        attr = getattr(self, key)
 
         if key in ["agents"]:
-            attr_pos = np.hstack(attr[(slice(None), index, 0)])
-            attr_fit = np.hstack(attr[(slice(None), index, 1)])
+            attr_pos = np.hstack([positions[index] for positions, _ in attr])
+            attr_fit = np.hstack([fits[index] for _, fits in attr])
 
             return attr_pos, attr_fit
 
         if key in ["best_agent"]:
-            attr_pos = np.hstack(attr[(slice(None), 0)])
-            attr_fit = np.hstack(attr[(slice(None), 1)])
+            attr_pos = np.hstack([position for position, _ in attr])
+            attr_fit = np.hstack([fit for _, fit in attr])
 
             return attr_pos, attr_fit
 
+        attr = np.asarray(attr, dtype=list)
+
         if key in ["local_position"]:
             attr_pos = np.hstack(attr[(slice(None), index)])
 
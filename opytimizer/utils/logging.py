@@ -22,6 +22,10 @@ class Logger(logging.Logger):
 
         """
 
+        # Avoids toggling the handlers whenever the message would not be logged
+        if not self.isEnabledFor(logging.INFO):
+            return
+
         self.handlers[0].setLevel(logging.CRITICAL)
         self.info(msg, *args, **kwargs)
         self.handlers[0].setLevel(LOG_LEVEL)
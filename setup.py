@@ -26,6 +26,12 @@ setup(
         "tqdm>=4.49.0",
     ],
     extras_require={
+        "cupy": [
+            "cupy>=9.0.0",
+        ],
+        "numba": [
+            "numba>=0.53.0",
+        ],
         "tests": [
             "coverage",
             "pytest",
@@ -1,3 +1,4 @@
+import dill
 import numpy as np
 
 from opytimizer.core import function
@@ -48,6 +49,102 @@ def test_function_pointer_setter():
     )
 
 
+def test_function_vectorized():
+    new_function = function.Function(pointer, vectorized=True)
+
+    assert new_function.vectorized is True
+
+
+def test_function_vectorized_setter():
+    new_function = function.Function(pointer)
+
+    try:
+        new_function.vectorized = 1
+    except:
+        new_function.vectorized = False
+
+    assert new_function.vectorized is False
+
+
+def test_function_cache_size():
+    new_function = function.Function(pointer, cache_size=2)
+
+    assert new_function.cache_size == 2
+
+
+def test_function_cache_size_setter():
+    new_function = function.Function(pointer)
+
+    try:
+        new_function.cache_size = "a"
+    except:
+        new_function.cache_size = 1
+
+    try:
+        new_function.cache_size = -1
+    except:
+        new_function.cache_size = 1
+
+    assert new_function.cache_size == 1
+
+
+def test_function_call_cached():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+
+        return np.sum(x**2)
+
+    new_function = function.Function(square, cache_size=2)
+
+    assert new_function(np.ones((2, 1))) == 2
+    assert new_function(np.ones((2, 1))) == 2
+    assert new_function(np.zeros((2, 1))) == 0
+    assert len(calls) == 2
+    assert calls[0].shape == (2, 1)
+
+    new_function = dill.loads(dill.dumps(new_function))
+
+    assert new_function(np.ones((2, 1))) == 2
+
+
+def test_function_pool():
+    new_function = function.Function(pointer)
+
+    assert new_function.pool is None
+
+
+def test_function_open_pool():
+    new_function = function.Function(pointer)
+
+    try:
+        new_function.open_pool(0)
+    except:
+        new_function.open_pool(2)
+
+    assert new_function.pool is not None
+
+    new_function.close_pool()
+
+    assert new_function.pool is None
+
+
+def test_function_map():
+    def square(x):
+        return np.sum(x**2)
+
+    new_function = function.Function(square)
+
+    assert new_function.map([np.ones(2), np.zeros(2)]) == [2, 0]
+
+    new_function.open_pool(2)
+
+    assert new_function.map([np.ones(2), np.zeros(2)]) == [2, 0]
+
+    new_function.close_pool()
+
+
 def test_function_built():
     new_function = function.Function(pointer)
 
@@ -85,6 +182,36 @@ def test_function_call():
     assert new_function.name == "square"
 
 
+def test_function_call_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
+
+    assert new_function(np.ones((2, 1))) == 2
+
+
+def test_function_batch():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
+
+    assert np.array_equal(new_function.batch(np.ones((3, 2, 1))), [2, 2, 2])
+
+    def total(x):
+        return np.sum(x)
+
+    new_function = function.Function(total, vectorized=True)
+
+    try:
+        new_function.batch(np.ones((3, 2, 1)))
+    except:
+        new_function = function.Function(lambda x: np.sum(x**2))
+
+    assert np.array_equal(new_function.batch(np.ones((3, 2, 1))), [2, 2, 2])
+
+
 def test_function():
     class Square:
         def __call__(self, x):
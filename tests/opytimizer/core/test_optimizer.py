@@ -3,6 +3,7 @@ import sys
 import numpy as np
 
 from opytimizer.core import function, optimizer
+from opytimizer.functions import constrained, vectorized
 from opytimizer.spaces import search
 
 
@@ -88,3 +89,71 @@ def test_optimizer_evaluate():
     new_optimizer.evaluate(new_search_space, new_function)
 
     assert new_search_space.best_agent.fit < sys.float_info.max
+
+
+def test_optimizer_evaluate_handed_over():
+    def square(x):
+        return np.sum(x**2)
+
+    new_function = function.Function(square)
+    new_search_space = search.SearchSpace(
+        n_agents=2, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    for agent in new_search_space.agents:
+        agent.fit = -1.0
+
+    new_optimizer = optimizer.Optimizer()
+    new_optimizer._hand_over_fits(new_search_space, new_search_space.gather_fits())
+    new_optimizer.evaluate(new_search_space, new_function)
+
+    assert new_search_space.best_agent.fit == -1
+
+    new_optimizer._hand_over_fits(new_search_space, new_search_space.gather_fits())
+    new_search_space.agents[0].position[:] = 0
+    new_optimizer.evaluate(new_search_space, new_function)
+
+    assert new_search_space.agents[0].fit == 0
+
+def test_optimizer_evaluate_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
+    new_search_space = search.SearchSpace(
+        n_agents=2, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_optimizer = optimizer.Optimizer()
+    new_optimizer.evaluate(new_search_space, new_function)
+
+    assert new_search_space.best_agent.fit == min(new_search_space.gather_fits())
+
+    def total(x):
+        return np.sum(x)
+
+    new_function = function.Function(total, vectorized=True)
+
+    try:
+        new_optimizer.evaluate(new_search_space, new_function)
+    except:
+        new_function = function.Function(square, vectorized=True)
+
+    assert new_function.pointer is square
+
+
+def test_optimizer_evaluate_vectorized_constrained():
+    def c_1(x):
+        return x[0] + x[1] <= 0
+
+    new_function = constrained.ConstrainedFunction(vectorized.sphere, [c_1], 100)
+    new_search_space = search.SearchSpace(
+        n_agents=2, n_variables=2, lower_bound=[1, 1], upper_bound=[10, 10]
+    )
+
+    new_optimizer = optimizer.Optimizer()
+    new_optimizer.evaluate(new_search_space, new_function)
+
+    # Every agent violates the constraint, thus every fitness is penalized
+    for agent in new_search_space.agents:
+        assert np.isclose(agent.fit, 101 * np.sum(agent.position**2))
@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import pytest
 
@@ -81,6 +83,46 @@ def test_space_agents_setter():
     assert new_space.agents == []
 
 
+def test_space_positions():
+    new_space = space.Space(
+        n_agents=2, n_variables=2, lower_bound=[0, 0], upper_bound=[1, 1]
+    )
+    new_space.build()
+
+    new_space.positions[0] = 1
+
+    assert new_space.positions.shape == (2, 2, 1)
+    assert new_space.agents[0].position[0] == 1
+
+    new_space.agents[1].position = np.full((2, 1), 2.0)
+
+    assert new_space.positions[1, 0] == 2
+
+    new_space.agents.reverse()
+
+    assert new_space.positions[0, 0] == 2
+    assert new_space.agents[0].position is not new_space.agents[1].position
+
+    copied_space = copy.deepcopy(new_space)
+    copied_space.agents[0].position[0] = 5
+
+    copied_space.clip_by_bound()
+
+    assert copied_space.agents[0].position[0] == 1
+    assert copied_space.agents[0].position.base is copied_space.positions
+
+    copied_space.agents[1].position = np.array([0.5, 0.25])
+
+    assert copied_space.positions.shape == (2, 2, 1)
+    assert copied_space.agents[1].position.shape == (2, 1)
+    assert copied_space.agents[1].position[1, 0] == 0.25
+
+    for a in copied_space.agents:
+        a.position = np.zeros((2, 2))
+
+    assert copied_space.positions.shape == (2, 2, 2)
+
+
 def test_space_best_agent():
     new_space = space.Space()
 
@@ -195,6 +237,18 @@ def test_space_create_agents():
     assert len(new_space.agents) == 2
 
 
+def test_space_gather_fits():
+    new_space = space.Space(n_agents=2, n_variables=1, n_dimensions=1)
+    new_space.build()
+
+    new_space.agents[1].fit = 1
+
+    fits = new_space.gather_fits()
+
+    assert fits.shape == (2,)
+    assert fits[1] == 1
+
+
 def test_space_initialize_agents():
     new_space = space.Space(n_agents=2, n_variables=1, n_dimensions=1)
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from opytimizer.functions import constrained
+from opytimizer.functions import constrained, vectorized
 from opytimizer.utils import constant
 
 
@@ -127,3 +127,32 @@ def test_constrained_call():
 
     assert new_constrained_function(np.zeros(2)) == 0
     assert new_constrained_function(np.ones(2)) == 202
+
+
+def test_constrained_call_vectorized():
+    def c_1(x):
+        return x[0] + x[1] <= 0
+
+    new_constrained_function = constrained.ConstrainedFunction(
+        vectorized.sphere, [c_1], 100
+    )
+
+    assert new_constrained_function.vectorized is True
+
+    fit = new_constrained_function(np.ones((2, 1)))
+
+    assert np.ndim(fit) == 0
+    assert fit == 202
+
+
+def test_constrained_batch():
+    def c_1(x):
+        return x[0] + x[1] <= 0
+
+    new_constrained_function = constrained.ConstrainedFunction(
+        vectorized.sphere, [c_1], 100
+    )
+
+    fits = new_constrained_function.batch(np.stack([np.zeros((2, 1)), np.ones((2, 1))]))
+
+    assert np.array_equal(fits, [0, 202])
@@ -0,0 +1,61 @@
+import numpy as np
+
+from opytimizer.core import function
+from opytimizer.functions import vectorized
+
+
+def test_vectorized_sphere():
+    x = np.ones((4, 3, 1))
+
+    fits = vectorized.sphere(x)
+
+    assert fits.shape == (4,)
+    assert np.all(fits == 3)
+
+
+def test_vectorized_sphere_without_kernels():
+    x = np.random.uniform(-1, 1, (4, 3, 2))
+
+    fits = vectorized.sphere(x)
+
+    k = vectorized.k
+    vectorized.k = None
+
+    try:
+        assert np.allclose(vectorized.sphere(x), fits)
+    finally:
+        vectorized.k = k
+
+
+def test_vectorized_rastrigin():
+    x = np.zeros((4, 3, 1))
+
+    fits = vectorized.rastrigin(x)
+
+    assert fits.shape == (4,)
+    assert np.allclose(fits, 0)
+
+
+def test_vectorized_rastrigin_without_kernels():
+    x = np.random.uniform(-1, 1, (4, 3, 2))
+
+    fits = vectorized.rastrigin(x)
+
+    k = vectorized.k
+    vectorized.k = None
+
+    try:
+        assert np.allclose(vectorized.rastrigin(x), fits)
+    finally:
+        vectorized.k = k
+
+
+def test_vectorized_function():
+    new_function = function.Function(vectorized.sphere)
+
+    assert new_function.vectorized is True
+    assert new_function(np.ones((3, 1))) == 3
+
+    new_function = function.Function(vectorized.rastrigin, vectorized=False)
+
+    assert new_function.vectorized is False
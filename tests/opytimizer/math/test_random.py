@@ -11,6 +11,13 @@ def test_generate_binary_random_number():
     assert binary_array.shape == (5,)
 
 
+def test_generate_binomial_random_number():
+    binomial_array = random.generate_binomial_random_number(10, 0.5, 5)
+
+    assert binomial_array.shape == (5,)
+    assert np.all((binomial_array >= 0) & (binomial_array <= 10))
+
+
 def test_generate_exponential_random_number():
     exponential_array = random.generate_exponential_random_number(1, 5)
 
@@ -33,6 +40,23 @@ def test_generate_integer_random_number():
     assert integer_array.shape == (9,)
 
 
+def test_generate_unique_integer_random_number():
+    unique_array = random.generate_unique_integer_random_number(10, 1010, 50)
+
+    assert unique_array.shape == (50,)
+    assert len(np.unique(unique_array)) == 50
+    assert np.all((unique_array >= 10) & (unique_array < 1010))
+
+    unique_array = random.generate_unique_integer_random_number(0, 10, 9)
+
+    assert len(np.unique(unique_array)) == 9
+    assert np.all((unique_array >= 0) & (unique_array < 10))
+
+    unique_array = random.generate_unique_integer_random_number(0, 10, 0)
+
+    assert unique_array.shape == (0,)
+
+
 def test_generate_uniform_random_number():
     uniform_array = random.generate_uniform_random_number(0, 1, 5)
 
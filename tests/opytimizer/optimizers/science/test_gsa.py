@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 
 from opytimizer.optimizers.science import gsa
@@ -29,6 +31,18 @@ def test_gsa_params_setter():
 
     assert new_gsa.G == 0.1
 
+    try:
+        new_gsa.device = 1
+    except:
+        new_gsa.device = "cpu"
+
+    try:
+        new_gsa.device = "tpu"
+    except:
+        new_gsa.device = "cpu"
+
+    assert new_gsa.device == "cpu"
+
 
 def test_gsa_compile():
     search_space = search.SearchSpace(
@@ -56,12 +70,14 @@ def test_gsa_calculate_mass():
 
     search_space.agents[0].fit = 1
 
-    search_space.agents.sort(key=lambda x: x.fit)
-
-    mass = new_gsa._calculate_mass(search_space.agents)
+    mass = new_gsa._calculate_mass(search_space.gather_fits())
 
     assert len(mass) > 0
 
+    mass = new_gsa._calculate_mass(np.ones(10))
+
+    assert np.all(mass == 0.1)
+
 
 def test_gsa_calculate_force():
     search_space = search.SearchSpace(
@@ -73,16 +89,44 @@ def test_gsa_calculate_force():
 
     search_space.agents[0].fit = 1
 
-    search_space.agents.sort(key=lambda x: x.fit)
-
-    mass = new_gsa._calculate_mass(search_space.agents)
+    mass = new_gsa._calculate_mass(search_space.gather_fits())
 
     gravity = 1
 
-    force = new_gsa._calculate_force(search_space.agents, mass, gravity)
+    force = new_gsa._calculate_force(search_space.positions, mass, gravity)
 
     assert force.shape[0] > 0
 
+    force = new_gsa._calculate_force(
+        search_space.positions, mass, gravity, np.zeros((10, 10))
+    )
+
+    assert np.all(force == 0)
+
+
+def test_gsa_calculate_pairwise_force():
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_gsa = gsa.GSA()
+    new_gsa.compile(search_space)
+
+    for i, agent in enumerate(search_space.agents):
+        agent.fit = i
+
+    mass = new_gsa._calculate_mass(search_space.gather_fits())
+    rand = np.random.uniform(size=(10, 10))
+
+    force = new_gsa._calculate_force(search_space.positions, mass, 1, rand)
+    pairwise_force = new_gsa._calculate_pairwise_force(
+        search_space.positions, mass, 1, rand
+    )
+
+    assert pairwise_force.shape == (10, 2, 1)
+    assert np.any(force != 0)
+    assert np.allclose(pairwise_force, force)
+
 
 def test_gsa_update():
     search_space = search.SearchSpace(
@@ -93,3 +137,53 @@ def test_gsa_update():
     new_gsa.compile(search_space)
 
     new_gsa.update(search_space, 1)
+
+
+def test_gsa_update_keeps_agents_order():
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    for i, agent in enumerate(search_space.agents):
+        agent.fit = 10 - i
+
+    agents = list(search_space.agents)
+    positions = search_space.positions
+
+    new_gsa = gsa.GSA()
+    new_gsa.compile(search_space)
+    new_gsa.update(search_space, 1)
+
+    assert search_space.agents == agents
+    for i, agent in enumerate(search_space.agents):
+        assert agent.position.base is positions
+        assert np.array_equal(agent.position, positions[i])
+
+
+def test_gsa_update_without_kernels():
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    for i, agent in enumerate(search_space.agents):
+        agent.fit = i
+
+    new_gsa = gsa.GSA()
+    new_gsa.compile(search_space)
+    new_gsa.velocity = np.random.uniform(size=new_gsa.velocity.shape)
+
+    numpy_space = copy.deepcopy(search_space)
+    numpy_gsa = copy.deepcopy(new_gsa)
+
+    np.random.seed(0)
+    new_gsa.update(search_space, 1)
+
+    kernels, gsa.k = gsa.k, None
+    try:
+        np.random.seed(0)
+        numpy_gsa.update(numpy_space, 1)
+    finally:
+        gsa.k = kernels
+
+    assert np.allclose(search_space.positions, numpy_space.positions)
+    assert np.allclose(new_gsa.velocity, numpy_gsa.velocity)
@@ -1,5 +1,7 @@
 import numpy as np
 
+from opytimizer import Opytimizer
+from opytimizer.core import function
 from opytimizer.optimizers.science import hgso
 from opytimizer.spaces import search
 
@@ -179,3 +181,20 @@ def test_hgso_update():
     new_hgso.compile(search_space)
 
     new_hgso.update(search_space, square, 1, 10)
+
+
+def test_hgso_start():
+    def square(x):
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=20, n_variables=2, lower_bound=[-10, -10], upper_bound=[10, 10]
+    )
+
+    opt = Opytimizer(search_space, hgso.HGSO(), function.Function(square))
+    opt.start(n_iterations=5)
+
+    # Re-drawn agents (eq. 12) must keep their positions' shape and stay attached
+    for agent in opt.space.agents:
+        assert agent.position.shape == (2, 1)
+        assert agent.position.base is opt.space.positions
@@ -1,5 +1,6 @@
 import numpy as np
 
+from opytimizer.core import function
 from opytimizer.optimizers.swarm import ba
 from opytimizer.spaces import search
 
@@ -124,3 +125,57 @@ def test_ba_update():
     new_ba.compile(search_space)
 
     new_ba.update(search_space, square, 1)
+
+
+def test_ba_update_improving_agents():
+    fits = np.array([6, 4, 7, 3, 3.5, 2, 2.5])
+
+    def constant(x):
+        return fits
+
+    search_space = search.SearchSpace(
+        n_agents=7, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+    search_space.best_agent.fit = 5
+
+    new_ba = ba.BA()
+    new_ba.compile(search_space)
+
+    new_ba.pulse_rate = np.zeros(7)
+    new_ba.loudness = np.array([2, 2, 2, 2, 2, 0, 2], dtype=float)
+
+    new_ba.update(search_space, function.Function(constant, vectorized=True), 1)
+
+    improved = np.array([False, True, False, True, False, False, True])
+
+    assert np.allclose(new_ba.pulse_rate[improved], new_ba.r * (1 - np.exp(-0.9)))
+    assert np.all(new_ba.pulse_rate[~improved] == 0)
+    assert np.allclose(new_ba.loudness[improved], new_ba.A * 0.9)
+    assert np.array_equal(new_ba.loudness[~improved], [2, 2, 2, 0])
+
+    assert search_space.best_agent.fit == 2.5
+    assert np.array_equal(
+        search_space.best_agent.position, search_space.agents[6].position
+    )
+
+
+def test_ba_update_evaluates_once():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_ba = ba.BA()
+    new_ba.compile(search_space)
+
+    new_ba.update(search_space, square, 1)
+    new_ba.evaluate(search_space, square)
+
+    assert len(calls) == 10
+    assert search_space.best_agent.fit == min(search_space.gather_fits())
@@ -1,5 +1,9 @@
+import copy
+
 import numpy as np
 
+from opytimizer.core import function
+from opytimizer.functions import vectorized
 from opytimizer.optimizers.swarm import sbo
 from opytimizer.spaces import search
 
@@ -64,12 +68,16 @@ def test_sbo_compile():
     new_sbo = sbo.SBO()
     new_sbo.compile(search_space)
 
+    assert new_sbo.sigma.shape == (2,)
+    assert new_sbo._previous_positions.shape == (2, 2, 1)
+    assert new_sbo._step.shape == (2, 2, 1)
+
     try:
         new_sbo.sigma = 1
     except:
-        new_sbo.sigma = []
+        new_sbo.sigma = np.array([1])
 
-    assert new_sbo.sigma == []
+    assert new_sbo.sigma == np.array([1])
 
 
 def test_sbo_update():
@@ -85,3 +93,99 @@ def test_sbo_update():
     new_sbo.p_mutation = 1
 
     new_sbo.update(search_space, square)
+
+    for agent in search_space.agents:
+        assert agent.fit == square(agent.position)
+        assert np.all(agent.position >= 1) and np.all(agent.position <= 10)
+
+
+def test_sbo_update_without_mutation():
+    def square(x):
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[1, 1], upper_bound=[10, 10]
+    )
+
+    new_sbo = sbo.SBO()
+    new_sbo.compile(search_space)
+    new_sbo.p_mutation = 0
+
+    np.random.seed(0)
+    new_sbo.update(search_space, square)
+    state = np.random.get_state()[1]
+
+    # Only the bowers' choices should have been drawn
+    np.random.seed(0)
+    np.random.uniform(size=(10, 2))
+
+    assert np.array_equal(state, np.random.get_state()[1])
+
+
+def test_sbo_update_evaluates_once():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[1, 1], upper_bound=[10, 10]
+    )
+
+    new_sbo = sbo.SBO()
+    new_sbo.compile(search_space)
+
+    new_sbo.update(search_space, square)
+    new_sbo.evaluate(search_space, square)
+
+    assert len(calls) == 10
+    assert search_space.best_agent.fit == min(search_space.gather_fits())
+
+
+def test_sbo_update_vectorized():
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[1, 1], upper_bound=[10, 10]
+    )
+
+    new_function = function.Function(vectorized.sphere)
+
+    new_sbo = sbo.SBO()
+    new_sbo.compile(search_space)
+
+    new_sbo.update(search_space, new_function)
+
+    for agent in search_space.agents:
+        assert np.isclose(agent.fit, np.sum(agent.position**2))
+
+
+def test_sbo_update_without_kernels():
+    def square(x):
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[1, 1], upper_bound=[10, 10]
+    )
+
+    for i, agent in enumerate(search_space.agents):
+        agent.fit = i
+
+    new_sbo = sbo.SBO()
+    new_sbo.compile(search_space)
+    new_sbo.p_mutation = 0.5
+
+    numpy_space = copy.deepcopy(search_space)
+    numpy_sbo = copy.deepcopy(new_sbo)
+
+    np.random.seed(0)
+    new_sbo.update(search_space, square)
+
+    kernels, sbo.k = sbo.k, None
+    try:
+        np.random.seed(0)
+        numpy_sbo.update(numpy_space, square)
+    finally:
+        sbo.k = kernels
+
+    assert np.allclose(search_space.positions, numpy_space.positions)
@@ -1,6 +1,7 @@
 import opytimizer
 from opytimizer.core import function
-from opytimizer.optimizers.swarm import pso
+from opytimizer.optimizers.science import gsa
+from opytimizer.optimizers.swarm import ba, pso
 from opytimizer.spaces import search
 from opytimizer.utils import callback, history
 
@@ -228,6 +229,36 @@ def test_opytimizer_start():
     new_opytimizer.start(n_iterations=1)
 
 
+def test_opytimizer_start_n_jobs():
+    space = search.SearchSpace(2, 1, 0, 1)
+    func = function.Function(lambda x: x.sum())
+    optimizer = pso.PSO()
+
+    new_opytimizer = opytimizer.Opytimizer(space, optimizer, func)
+
+    new_opytimizer.start(n_iterations=1, n_jobs=2)
+
+    assert new_opytimizer.function.pool is None
+
+
+def test_opytimizer_start_moving_callback():
+    class MoveAgents(callback.Callback):
+        def on_update_after(self, *update_args):
+            for agent in new_opytimizer.space.agents:
+                agent.position[:] = 1
+
+    space = search.SearchSpace(5, 2, [0, 0], [1, 1])
+    func = function.Function(lambda x: x.sum())
+    optimizer = ba.BA()
+
+    new_opytimizer = opytimizer.Opytimizer(space, optimizer, func)
+    new_opytimizer.start(n_iterations=1, callbacks=[MoveAgents()])
+
+    # Agents moved after the update must be evaluated at their new positions
+    for agent in new_opytimizer.space.agents:
+        assert agent.fit == 2
+
+
 def test_opytimizer_save():
     space = search.SearchSpace(1, 1, 0, 1)
     func = function.Function(callable)
@@ -242,3 +273,26 @@ def test_opytimizer_load():
     new_opytimizer = opytimizer.Opytimizer.load("out.pkl")
 
     assert type(new_opytimizer).__name__ == "Opytimizer"
+
+
+def test_opytimizer_load_update():
+    space = search.SearchSpace(5, 2, [0, 0], [1, 1])
+    func = function.Function(lambda x: x.sum())
+    optimizer = gsa.GSA()
+
+    new_opytimizer = opytimizer.Opytimizer(space, optimizer, func)
+    new_opytimizer.start(n_iterations=1)
+    new_opytimizer.save("out.pkl")
+
+    new_opytimizer = opytimizer.Opytimizer.load("out.pkl")
+    agents = new_opytimizer.space.agents
+    positions = [agent.position.copy() for agent in agents]
+
+    new_opytimizer.start(n_iterations=3)
+
+    assert any(
+        not (agent.position == position).all()
+        for agent, position in zip(agents, positions)
+    )
+    for agent in agents:
+        assert agent.position.base is new_opytimizer.space.positions
@@ -33,6 +33,8 @@ def test_history_dump():
 
     assert len(new_history.agents) > 0
     assert len(new_history.best_agent) > 0
+    assert new_history.agents[0][0].shape == (5, 2, 1)
+    assert new_history.agents[0][1].shape == (5,)
     assert new_history.value[0] == 0
 
     new_history = history.History(save_agents=False)
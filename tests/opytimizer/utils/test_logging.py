@@ -25,3 +25,12 @@ def test_logging_get_logger():
     assert logger.name == "test_logging"
 
     assert logger.hasHandlers() is True
+
+
+def test_logging_to_file_disabled():
+    logger = logging.get_logger(__name__)
+    logger.setLevel(logging.logging.WARNING)
+
+    assert logger.to_file("msg") is None
+
+    logger.setLevel(logging.LOG_LEVEL)